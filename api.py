@@ -5,13 +5,38 @@ if TYPE_CHECKING:
     from .builder.main import RunGraphRoot
     from .builder.routine_classes import Routine
 
-import copy
+import multiprocessing
+import os
+import pickle
+import sys
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Sequence
 
 from .builder.main import GraphBuilder, UserGraphRoot
 from .inputparser.main import FileParser
 from .essentials import Performable, Propagator, System
+from .settings import SETTINGS
+
+# Schedules hold closures and cannot be pickled, forked workers inherit them.
+# Only set inside the worker processes of a single parallel perform call.
+_WORKER_SCHEDULES: tuple[Schedule] = ()
+
+
+def _init_worker(schedules: tuple[Schedule]):
+    global _WORKER_SCHEDULES
+    _WORKER_SCHEDULES = schedules
+
+
+def _perform_forked(index: int, verbose: bool) -> bytes | None:
+    """Perform a schedule, return its pickled final state or None."""
+    sch = _WORKER_SCHEDULES[index]
+    sch.perform(verbose)
+    try:
+        return pickle.dumps((sch.results, sch._system.psi,
+                             sch._system.time))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
 
 
 class Protocol(Performable):
@@ -35,25 +60,20 @@ class Protocol(Performable):
         else:
             self.label = label
 
-        self._schedules = tuple(schedules)
-        schedule_labels = set()
+        self._schedules: list[Schedule] = list(schedules)
+        self._map: dict[str, Schedule] = {}
         for sch in self._schedules:
-            if sch.label in schedule_labels:
+            if sch.label in self._map:
                 raise ValueError(f"Duplicate schedule label {sch.label}")
-            schedule_labels |= set(sch.label)
+            self._map[sch.label] = sch
 
         self.results = {}
 
-    @property
-    def _map(self) -> dict[str, Schedule]:
-        labels = (sch.label for sch in self._schedules)
-        return dict(zip(labels, self._schedules))
-
     def _select_schedules(self, schedule_labels: Sequence[str] = None):
         if schedule_labels is None:
             return self._schedules
         else:
-            return tuple([self._map[label] for label in schedule_labels])
+            return [self._map[label] for label in schedule_labels]
 
     def add_schedule(self, schedule: Schedule):
         """Add a schedule to the protocol.
@@ -67,7 +87,8 @@ class Protocol(Performable):
         if schedule.label in self._map:
             raise ValueError(f"Schedule label {schedule.label} already"
                              " exists.")
-        self._schedules += (schedule,)
+        self._schedules.append(schedule)
+        self._map[schedule.label] = schedule
 
     def duplicate_schedule(self, source_label: str, target_label: str):
         """Add copy of an already contained schedule to the protocol.
@@ -83,7 +104,8 @@ class Protocol(Performable):
                                     source_sched._system._propagator)
         self.add_schedule(new_sched)
 
-    def perform(self, schedule_labels: Sequence[str] | Sequence[int] = None):
+    def perform(self, schedule_labels: Sequence[str] | Sequence[int] = None,
+                verbose: bool = True):
         """Perform the specified schedules.
 
         By default performs all schedules.
@@ -92,13 +114,55 @@ class Protocol(Performable):
             schedule_labels (Sequence[str] | Sequence[int], optional):
                 Sequence of labels of schedules to be performed.
                 Defaults to None and performs all schedules in that case.
+            verbose (bool, optional): Print a line for every routine.
+                Otherwise, only routines with live tracking print output.
+                Defaults to True.
         """
-        for sch in self._select_schedules(schedule_labels):
-            self_label = f"'{self.label}'"
-            sch._output_str_prefix = f"PROTOCOL {self_label:>6}"
-            sch.perform()
+        self_label = f"'{self.label}'"
+        output_str_prefix = f"PROTOCOL {self_label:>6}"
+        schedules = self._select_schedules(schedule_labels)
+        for sch in schedules:
+            sch._set_output_str_prefix(output_str_prefix)
+
+        if (SETTINGS.PARALLEL_SCHEDULES and len(schedules) > 1
+                and sys.platform.startswith("linux")):
+            self._perform_parallel(schedules, verbose)
+            return
+
+        for sch in schedules:
+            sch.perform(verbose)
             self.results[sch.label] = sch.results
 
+    def _perform_parallel(self, schedules: Sequence[Schedule], verbose: bool):
+        """Perform schedules in forked worker processes.
+
+        The results and the final state and time of each system are sent back
+        to this process, so the schedules end up as after a serial perform.
+
+        Raises:
+            RuntimeError: Raised, if the results or the final state of a
+                schedule cannot be pickled.
+        """
+        max_workers = min(len(schedules), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(tuple(schedules),)) as pool:
+            futures = [pool.submit(_perform_forked, i, verbose)
+                       for i in range(len(schedules))]
+            for sch, future in zip(schedules, futures):
+                pickled_state = future.result()
+                if pickled_state is None:
+                    raise RuntimeError(
+                        f"Results of schedule '{sch.label}' cannot be"
+                        " pickled and sent back from a worker process."
+                        " Disable SETTINGS.PARALLEL_SCHEDULES to perform it.")
+
+                sch.results, sch._system.psi, sch._system._time = (
+                    pickle.loads(pickled_state))
+                self.results[sch.label] = sch.results
+
     def build(self, schedule_labels: Sequence[str] | Sequence[int] = None,
               start_time: float = None):
         """Set up schedules for execution.
@@ -144,6 +208,7 @@ class Schedule(Performable):
         super().__init__()
         self._user_graph = sched_graph
         self._predef_tasks = predef_tasks
+        self._builder: GraphBuilder = None
         self._run_graph: RunGraphRoot = None
         if label is not None:
             self.label = label
@@ -157,6 +222,7 @@ class Schedule(Performable):
         self._ready_for_execution = False
         self.results: dict[str, dict[float, Any]] = {}
         self._routines: tuple[Routine] = ()
+        self._routine_names: list[str] = []
         self._system_initialized = False
         if "start_time" not in self._user_graph.options.local:
             self.start_time = 0.0
@@ -212,9 +278,15 @@ class Schedule(Performable):
         self._set_live_tracking(routines, False)
 
     def duplicate(self, label: str | int) -> Schedule:
-        """Return a copy of the schedule with given label."""
-        copy_sched = copy.deepcopy(self)
-        copy_sched.label = label
+        """Return a copy of the schedule with given label.
+
+        Only the configuration of the schedule is copied. The copy has no
+        system and needs to be initialized and built before execution.
+        """
+        copy_sched = type(self)(self._user_graph.copy(), label,
+                                self._predef_tasks)
+        copy_sched._live_tracking = self._live_tracking.copy()
+        copy_sched._builder = self._builder
 
         return copy_sched
 
@@ -249,7 +321,7 @@ class Schedule(Performable):
                               sys_vars, propagator)
         self._system_initialized = True
 
-    def perform(self):
+    def perform(self, verbose: bool = True):
         """Run all stages and collect results.
 
         During execution, various information will be printed to stdout.
@@ -258,6 +330,11 @@ class Schedule(Performable):
         the schedule and can be accessed by their store token or routine name
         when no store token was defined.
 
+        Args:
+            verbose (bool, optional): Print a line for every routine.
+                Otherwise, only routines with live tracking print output.
+                Defaults to True.
+
         Raises:
             ValueError: Raised, if the schedule has not been built yet.
         """
@@ -265,41 +342,50 @@ class Schedule(Performable):
             raise ValueError("Schedule is not set up for execution. "
                              "Call .build().")
 
-        for i, routine in enumerate(self._routines):
-            stage_idx = routine.stage_idx
-
-            if routine.type == "propagation":
-                prop_string = f"PROPAGATE BY {routine.timestep:3.4f}"
-                name_string = (f">>>>>>>>>> {prop_string:^29} >>>>>>>>>>")
-            else:
-                name_string = (f"{routine.tag:>10}"
-                               f" {routine.store_token:<20}")
-            schedule_name = f"'{self.label}'"
-            text_prefix = " | ".join([
-                f"SCHEDULE {schedule_name:>6}:",
-                f"STAGE {stage_idx:>3}/{self.num_stages:<3}",
-                f"ROUTINE {i + 1:>{len(str(len(self._routines)))}}"
-                f"/{len(self._routines)}",
-                f"TIME {f'{self._system.time:.4f}':>10}",
-                f"{name_string}"])
-            textwrapper = textwrap.TextWrapper(width=250,
-                                               initial_indent=text_prefix)
+        schedule_name = f"'{self.label}'"
+        num_stages = self.num_stages
+        num_routines = len(self._routines)
+        routine_idx_width = len(str(num_routines))
+        # the label may contain braces, keep it out of the format template
+        schedule_prefix = f"SCHEDULE {schedule_name:>6}: | "
+        prefix_template = (f"STAGE {{:>3}}/{num_stages:<3} | ROUTINE"
+                           f" {{:>{routine_idx_width}}}/{num_routines}"
+                           " | TIME {:>10.4f} | {}")
+        textwrapper = textwrap.TextWrapper(width=250)
+        results = self.results
+        routines = zip(self._routines, self._routine_names)
+        for i, (routine, name_string) in enumerate(routines):
+            printing = verbose or routine.live_tracking
+            if printing:
+                text_prefix = schedule_prefix + prefix_template.format(
+                    routine.stage_idx, i + 1, self._system.time, name_string)
+
             output = routine(self._system)
-            if routine.live_tracking:
-                output_text = textwrapper.fill(f": {output[1]}")
-            else:
-                output_text = text_prefix
-            self._print_with_prefix(output_text)
+            if printing:
+                if routine.live_tracking:
+                    textwrapper.initial_indent = text_prefix
+                    output_text = textwrapper.fill(f": {output[1]}")
+                else:
+                    output_text = text_prefix
+                # only live tracked output needs to show up immediately
+                self._print_with_prefix(output_text,
+                                        flush=routine.live_tracking)
 
             if not routine.store:
                 continue
 
-            if output[0] not in self.results:
-                self.results[output[0]] = {
-                    self._system.time: output[1]}
-            else:
-                self.results[output[0]].update(
-                    {self._system.time: output[1]})
+            results.setdefault(output[0], {})[self._system.time] = output[1]
+
+        sys.stdout.flush()
+
+    @staticmethod
+    def _routine_name_string(routine: Routine) -> str:
+        """Return the routine column of the output lines of a routine."""
+        if routine.type == "propagation":
+            prop_string = f"PROPAGATE BY {routine.timestep:3.4f}"
+            return f">>>>>>>>>> {prop_string:^29} >>>>>>>>>>"
+
+        return f"{routine.tag:>10} {routine.store_token:<20}"
 
     def build(self, start_time=None, graph_only=False):
         """Build the run graph and generate all routines.
@@ -320,12 +406,16 @@ class Schedule(Performable):
         if start_time is not None:
             self.start_time = start_time
 
-        builder = GraphBuilder(self._predef_tasks)
-        self._run_graph = builder(self._user_graph)
+        if self._builder is None:
+            self._builder = GraphBuilder(self._predef_tasks)
+        # building mutates the graph, keep the configuration reusable
+        self._run_graph = self._builder(self._user_graph.copy())
         if graph_only:
             return
-        self._routines = builder.generate_routines(
+        self._routines = self._builder.generate_routines(
             self._system, self._run_graph)
+        self._routine_names = [self._routine_name_string(rout)
+                               for rout in self._routines]
         for rout in self._routines:
             if rout.store_token in self._live_tracking:
                 rout.set_live_tracking(self._live_tracking[rout.store_token])
@@ -15,13 +15,11 @@ class Inter2RunProcessor(GraphProcessor):
         super().__call__(input)
 
         rungraph = RunGraphRoot({})
-        rungraph.virtual_stages = []
+        run_stages = [None] * input.num_children
         for i, stage in enumerate(input.stages):
-            rungraph.virtual_stages += [
-                self._stagecompiler.compile(stage, rungraph)]
+            run_stages[i] = self._stagecompiler.compile(stage, rungraph)
 
-        rungraph.children = rungraph.virtual_stages
-        del rungraph.virtual_stages
+        rungraph.children = run_stages
         runspec = rungraph._GRAPH_SPEC
         runspec.processor.set_type(rungraph, True)
         runspec.processor.set_options(rungraph, True)
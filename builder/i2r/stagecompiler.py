@@ -16,7 +16,8 @@ class StageCompiler:
         self._out_rout_spec = self.output_type._GRAPH_SPEC.ranks["Routine"]
         out_stg_spec = self.output_type._GRAPH_SPEC.ranks["Stage"]
         self._out_rout_keys = {
-            k: v.options.keys() for k, v in self._out_rout_spec.types.items()
+            k: tuple(v.options.keys())
+            for k, v in self._out_rout_spec.types.items()
         }
         self._out_stg_keys = {k: v for k, v in out_stg_spec.types.items()}
         self._out_config_proc = self.output_type._GRAPH_SPEC.processor
@@ -42,7 +43,7 @@ class StageCompiler:
 
     def _compile_regular(self, interstage: InterGraphNode,
                          parent: RunGraphRoot) -> RunGraphNode:
-        routine_opts = (rout.options.local for rout in interstage.children)
+        routine_opts = [rout.options.local for rout in interstage.children]
         stage_opts = {
             "type": "regular"
             }
@@ -55,20 +56,12 @@ class StageCompiler:
     def _compile_evolution(self, interstage: InterGraphNode,
                            parent: RunGraphRoot) -> RunGraphNode:
         in_stg_opts = interstage.options.local
-        start_time = interstage.parent.options["start_time"]
-
-        if len(parent.virtual_stages) > 0:
-            start_time += parent.virtual_stages[
-                -1].options.local["propagation_time"]
-
+        start_time = in_stg_opts["start_time"]
         proptime = in_stg_opts["propagation_time"]
         stop_time = start_time + proptime
         numsteps = in_stg_opts["monitoring_numsteps"]
 
         monroutopts = in_stg_opts["monitoring"]
-        for opt in monroutopts:
-            if "store_token" not in opt:
-                opt["store_token"] = opt["routine_name"]
         out_stage: RunGraphNode = self.output_type(
             parent,
             {
@@ -78,22 +71,25 @@ class StageCompiler:
             rank=1)
         parent.add_children((out_stage,))
 
-        usrrouts = interstage.children
-        usr_timetable: dict[float, tuple[InterGraphNode]] = {}
+        usrrouts = interstage.children.tuple
+        copied_keys = tuple(
+            k for k in self._out_rout_keys["evolution"]
+            if k not in ("store_token", "tag", "time"))
+        usr_timetable: dict[float, list[dict]] = {}
         for rout in usrrouts:
-            opts = rout.options.local.copy()
-            opts.update({"tag": "USER"})
-            if opts["store_token"] == "":
-                opts["store_token"] = opts["routine_name"]
-            try:
-                time = rout.options["time"]
-            except KeyError:
-                time = start_time + rout.options["localtime"]
-
-            opts["time"] = time
-            outrout_opts = {
-                k: opts[k] for k in self._out_rout_keys["evolution"]}
-            outrout_opts.update({"type": "evolution"})
+            local = rout.options.local
+            if "time" in local:
+                time = local["time"]
+            else:
+                time = start_time + local["localtime"]
+
+            outrout_opts = {k: local[k] for k in copied_keys}
+            outrout_opts["store_token"] = local["store_token"]
+            if outrout_opts["store_token"] == "":
+                outrout_opts["store_token"] = local["routine_name"]
+            outrout_opts["tag"] = "USER"
+            outrout_opts["time"] = time
+            outrout_opts["type"] = "evolution"
 
             out_rout_kwargs = {
                 "parent": out_stage,
@@ -101,74 +97,54 @@ class StageCompiler:
                 "rank": 2
             }
 
-            if time not in usr_timetable:
-                usr_timetable[time] = [out_rout_kwargs]
-            else:
-                usr_timetable[time] += [out_rout_kwargs]
+            usr_timetable.setdefault(time, []).append(out_rout_kwargs)
 
-        usr_times = np.array(tuple(usr_timetable.keys()))
         mon_times = np.linspace(start_time,
                                 stop_time,
                                 numsteps,
-                                endpoint=True)
+                                endpoint=True).tolist()
 
-        mon_timetable: dict[float, tuple[InterGraphNode]] = {}
-        tdict = {
-            "tag": "MONITORING",
-            "type": "monitoring"
-        }
+        mon_timetable: dict[float, list[dict]] = {}
+        mon_base_opts = [
+            {"tag": "MONITORING", "type": "monitoring", **opt}
+            for opt in monroutopts
+        ]
         for time in mon_times:
-            tdict.update({"time": time})
             mon_rout_kwargs = []
-            for opt in monroutopts:
-                mon_rout_kwargs += [{
+            for base_opt in mon_base_opts:
+                opt = base_opt.copy()
+                opt["time"] = time
+                mon_rout_kwargs.append({
                     "parent": out_stage,
-                    "options": {**tdict, **opt},
+                    "options": opt,
                     "rank": 2
-                }]
+                })
 
             mon_timetable[time] = mon_rout_kwargs
 
-        rout_times = np.unique(np.concatenate([usr_times, mon_times]))
-        proptimes = np.diff(rout_times)
-        prop_timetable = {}
-        for time, step in zip(rout_times, proptimes):
-            opt = {
-                "type": "propagation",
-                "time": time,
-                "step": step
-            }
-            prop_timetable[time] = {
-                "parent": out_stage,
-                "options": opt,
-                "rank": 2,
-            }
-
+        rout_times = sorted(set(usr_timetable).union(mon_times))
+        proptimes = [t2 - t1 for t1, t2 in zip(rout_times, rout_times[1:])]
+        num_steps = len(proptimes)
         complete_timetable = []
-        for time in rout_times:
-            try:
-                complete_timetable.extend(mon_timetable[time])
-            except KeyError:
-                pass
-
-            try:
-                complete_timetable.extend(usr_timetable[time])
-            except KeyError:
-                pass
-
-            try:
-                complete_timetable.append(prop_timetable[time])
-            except KeyError:
-                pass
+        for i, time in enumerate(rout_times):
+            complete_timetable.extend(mon_timetable.get(time, ()))
+            complete_timetable.extend(usr_timetable.get(time, ()))
+            if i < num_steps:
+                complete_timetable.append({
+                    "parent": out_stage,
+                    "options": {
+                        "type": "propagation",
+                        "time": time,
+                        "step": proptimes[i]
+                    },
+                    "rank": 2,
+                })
 
         stage_id_tup = out_stage.ID.tuple
-
-        def stage_routines_gen():
-            for i, kwargs in enumerate(complete_timetable):
-                rout_id = tuple((*stage_id_tup, i))
-                yield self.output_type(**kwargs, ID=rout_id)
-
-        out_stage.children = tuple((stage_routines_gen()))
+        out_stage.children = [
+            self.output_type(**kwargs, ID=(*stage_id_tup, i))
+            for i, kwargs in enumerate(complete_timetable)
+        ]
         out_stage.options.update(
             {"num_routines": out_stage.num_routines})
 
@@ -16,7 +16,7 @@ from ..essentials import System
 
 
 def check_input(method):
-    input_type = tuple(typing.get_type_hints(method).values())[0]
+    input_type = next(iter(typing.get_type_hints(method).values()))
 
     @functools.wraps(method)
     def wrapped(obj: GraphProcessor, input_graph, **kwargs):
@@ -39,9 +39,6 @@ class GraphBuilder(GraphProcessor):
     @check_input
     def __call__(self, user_graph: UserGraphRoot) -> RunGraphRoot:
         """Preprocess, compile, verify and return."""
-        if not isinstance(user_graph, UserGraphRoot):
-            raise TypeError
-
         rungraph = self.i2r(self.u2i(user_graph))
         self.output_type._GRAPH_SPEC.processor.verify(rungraph, True)
         return rungraph
@@ -61,31 +58,28 @@ class GraphBuilder(GraphProcessor):
 
 class RoutineGenerator:
 
+    _ROUTINE_TYPES: dict[str, type[Routine]] = {
+        "propagation": PropagationRoutine,
+        "evolution": EvolutionRegularRoutine,
+        "monitoring": MonitoringRoutine,
+        "regular": RegularRoutine
+    }
+
     def __init__(self):
         pass
 
     def make(self, system: System, rungraph: RunGraphRoot) -> tuple[Routine]:
         routines = [None]*rungraph.num_routines
-        for i, routnode in enumerate(rungraph.routines):
-            stage_idx = routnode.parent.ID.local + 1
-            if routnode.type == "propagation":
-                routine = PropagationRoutine(routnode.options.local)
-                routine.stage_idx = stage_idx
-                routines[i] = routine
-            elif routnode.type == "evolution":
-                routine = EvolutionRegularRoutine(routnode.options.local,
-                                                  system)
-                routine.stage_idx = stage_idx
-                routines[i] = routine
-            elif routnode.type == "monitoring":
-                routine = MonitoringRoutine(routnode.options.local,
-                                            system)
-                routine.stage_idx = stage_idx
-                routines[i] = routine
-            elif routnode.type == "regular":
-                routine = RegularRoutine(routnode.options.local,
-                                         system)
+        i = 0
+        for stage_idx, stage in enumerate(rungraph.stages, start=1):
+            for routnode in stage.routines:
+                routine_type = self._ROUTINE_TYPES[routnode.type]
+                if routine_type is PropagationRoutine:
+                    routine = routine_type(routnode.options.local)
+                else:
+                    routine = routine_type(routnode.options.local, system)
                 routine.stage_idx = stage_idx
                 routines[i] = routine
+                i += 1
 
         return tuple(routines)
@@ -3,22 +3,29 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from inspect import _ParameterKind
-    from typing import Callable
+    from typing import Callable, Mapping
     from ..essentials import System
 
 import importlib.util
 import os
+import sys
 from abc import ABC, abstractmethod
+from functools import cache
 from inspect import signature, Parameter
+from types import MappingProxyType
 
 from ..settings import SETTINGS
 
 
-_functions_path = os.path.abspath(SETTINGS.FUNCTIONS_PATH)
-_functions_spec = importlib.util.spec_from_file_location(
-   "functions", _functions_path)
-_FUNCTIONS_MODULE = importlib.util.module_from_spec(_functions_spec)
-_functions_spec.loader.exec_module(_FUNCTIONS_MODULE)
+@cache
+def _functions_module():
+    """Load the module with the user-defined functions on first use."""
+    functions_path = os.path.abspath(SETTINGS.FUNCTIONS_PATH)
+    functions_spec = importlib.util.spec_from_file_location(
+        "functions", functions_path)
+    functions_module = importlib.util.module_from_spec(functions_spec)
+    functions_spec.loader.exec_module(functions_module)
+    return functions_module
 
 
 class RoutineInitializationError(Exception):
@@ -32,27 +39,44 @@ class RoutineInitializationError(Exception):
 
 class RoutineFunction:
     """Callable representing a function, the core of a routine."""
-    _FUNCTIONS_MODULE = _FUNCTIONS_MODULE
+    __slots__ = ("_name", "_function", "overwrite_psi", "_signature",
+                 "_params_by_kind", "_kwargs", "_positional_args")
 
     def __init__(self, routine_name):
         self._name = routine_name
         if self._name == "_return_state":
             self._function = lambda psi, /: psi
         else:
-            self._function = getattr(self._FUNCTIONS_MODULE, routine_name)
+            self._function = getattr(_functions_module(), routine_name)
 
         if hasattr(self._function, "overwrite_psi"):
             self.overwrite_psi = self._function.overwrite_psi
         else:
             self.overwrite_psi = False
 
+        self._signature = signature(self._function)
+        params_by_kind: dict[_ParameterKind, list[Parameter]] = {}
+        for param in self._signature.parameters.values():
+            params_by_kind.setdefault(param.kind, []).append(param)
+        # shared by all routines of that name, expose read-only views only
+        self._params_by_kind: Mapping[_ParameterKind, tuple[Parameter]] = (
+            MappingProxyType({kind: tuple(params) for kind, params
+                              in params_by_kind.items()}))
+
+        kwarg_kinds = (Parameter.VAR_POSITIONAL,
+                       Parameter.POSITIONAL_OR_KEYWORD,
+                       Parameter.KEYWORD_ONLY,
+                       Parameter.VAR_KEYWORD)
+        self._kwargs: Mapping[str, Parameter] = MappingProxyType(
+            {param.name: param for kind in kwarg_kinds
+             for param in self._params_of_kind(kind)})
+        self._positional_args = self._params_of_kind(Parameter.POSITIONAL_ONLY)
+
     def __call__(self, *args, **kwargs):
         return self._function(*args, **kwargs)
 
-    def _params_of_kind(self, kind: _ParameterKind) -> dict[str, Parameter]:
-        return {key: param for key, param in
-                self.signature.parameters.items() if param.kind
-                == kind}
+    def _params_of_kind(self, kind: _ParameterKind) -> tuple[Parameter]:
+        return self._params_by_kind.get(kind, ())
 
     @property
     def args(self):
@@ -60,22 +84,23 @@ class RoutineFunction:
         raise NotImplementedError
 
     @property
-    def kwargs(self) -> dict:
+    def kwargs(self) -> Mapping[str, Parameter]:
         """Return all parameters that can be passed by dict unpacking"""
-        return {
-            **self._params_of_kind(Parameter.VAR_POSITIONAL),
-            **self._params_of_kind(Parameter.POSITIONAL_OR_KEYWORD),
-            **self._params_of_kind(Parameter.KEYWORD_ONLY),
-            **self._params_of_kind(Parameter.VAR_KEYWORD)
-        }
+        return self._kwargs
 
     @property
-    def positional_args(self) -> dict:
-        return self._params_of_kind(Parameter.POSITIONAL_ONLY)
+    def positional_args(self) -> tuple[Parameter]:
+        return self._positional_args
 
     @property
     def signature(self):
-        return signature(self._function)
+        return self._signature
+
+
+@cache
+def _routine_function(routine_name: str) -> RoutineFunction:
+    """Return the RoutineFunction shared by all routines of that name."""
+    return RoutineFunction(routine_name)
 
 
 class Routine(ABC):
@@ -116,12 +141,18 @@ class RegularRoutine(Routine):
     def __init__(self, options, system: System):
         super().__init__(options)
         try:
-            self.tag = self._options["tag"]
+            self.tag = sys.intern(self._options["tag"])
         except KeyError:
             self.tag = "USER"
 
+        # tokens key the results dict on every call, intern them once
+        if self._options["store_token"] is not None:
+            self.store_token = sys.intern(self._options["store_token"])
+        else:
+            self.store_token = sys.intern(self.name)
+
         self._live_tracking = self._options["live_tracking"]
-        self._rfunction = RoutineFunction(self.name)
+        self._rfunction = _routine_function(self.name)
         self._make_rfunction_partial(system.sys_vars)
         self.store = self._options["store"]
         self._overwrite = self._rfunction.overwrite_psi
@@ -149,13 +180,6 @@ class RegularRoutine(Routine):
     def passed_kwargs(self) -> dict:
         return self._options["kwargs"]
 
-    @property
-    def store_token(self):
-        if self._options["store_token"] is not None:
-            return self._options["store_token"]
-        else:
-            return self.name
-
     def _check_kwargs(self):
         """Check for unknown keyword arguments."""
         unknown = set()
@@ -172,24 +196,14 @@ class RegularRoutine(Routine):
         """Set all parameters of the function except for psi."""
         self._check_kwargs()
         rf_sig = self._rfunction.signature
-        rf_params = rf_sig.parameters
-
-        pos_args = [
-            param for param in rf_params.values() if
-            param.kind == param.POSITIONAL_ONLY
-        ]
-        args = [
-            param for param in rf_params.values() if
-            param.kind == param.VAR_POSITIONAL
-        ]
-        kwargs = [
-            param for param in rf_params.values() if
-            param.kind not in (param.VAR_POSITIONAL,
-                               param.POSITIONAL_ONLY)
+        pos_args = self._rfunction.positional_args
+        non_pos_args = [
+            param for param in rf_sig.parameters.values() if
+            param.kind != param.POSITIONAL_ONLY
         ]
 
         pos_sig = rf_sig.replace(parameters=pos_args)
-        non_pos_sig = rf_sig.replace(parameters=(*args, *kwargs))
+        non_pos_sig = rf_sig.replace(parameters=non_pos_args)
         bound_params = non_pos_sig.bind(*self.passed_args,
                                         **self.passed_kwargs)
 
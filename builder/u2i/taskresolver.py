@@ -1,3 +1,5 @@
+import copy
+
 from .. import UserGraphNode
 from ...graph_classes.parser.file import PreDefinedTask
 
@@ -18,10 +20,23 @@ class TaskResolver:
             if not isinstance(task_opts, PreDefinedTask):
                 raise TypeError
 
+    @staticmethod
+    def _task_nodes(node: UserGraphNode) -> list[UserGraphNode]:
+        """Return all task nodes of the local graph in graph order."""
+        tasks = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.rank_name() == "Task":
+                tasks.append(node)
+            else:
+                stack.extend(reversed(node.children.tuple))
+        return tasks
+
     def inline(self, task_node: UserGraphNode, graph=False):
         if graph:
-            for ch in task_node:
-                self.inline(ch)
+            for task in self._task_nodes(task_node):
+                self.inline(task)
             return
 
         if task_node.rank_name() != "Task":
@@ -67,7 +82,7 @@ class TaskResolver:
         predef_task: PreDefinedTask = self._predef_tasks[taskname]
         inlined_task = UserGraphNode(
             task_node.parent,
-            predef_task.options.local,
+            copy.deepcopy(predef_task.options.local),
             rank=2)
         _usrcfg.processor.process(inlined_task)
         task_node.parent.replace_child(
@@ -75,8 +90,8 @@ class TaskResolver:
 
     def resolve(self, task_node: UserGraphNode, graph=False):
         if graph:
-            for ch in task_node:
-                self.resolve(ch)
+            for task in self._task_nodes(task_node):
+                self.resolve(task)
             return
 
         if task_node.rank_name() != "Task":
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from typing import Any
-import sys
 
 
 class Performable(ABC):
@@ -8,7 +7,7 @@ class Performable(ABC):
 
     @abstractmethod
     def __init__(self):
-        self._output_str_prefix = None
+        self._set_output_str_prefix(None)
 
     @abstractmethod
     def perform(self):
@@ -18,14 +17,15 @@ class Performable(ABC):
     def build(self):
         pass
 
-    def _print_with_prefix(self, out_str):
-        if self._output_str_prefix is not None:
-            out = " | ".join([self._output_str_prefix, out_str])
+    def _set_output_str_prefix(self, prefix: str | None):
+        self._output_str_prefix = prefix
+        if prefix is not None:
+            self._output_line_prefix = f"{prefix} | "
         else:
-            out = out_str
+            self._output_line_prefix = ""
 
-        print(out)
-        sys.stdout.flush()
+    def _print_with_prefix(self, out_str, flush=True):
+        print(self._output_line_prefix + out_str, flush=flush)
 
 
 class Propagator(ABC):
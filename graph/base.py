@@ -12,7 +12,6 @@ import copy
 import functools
 import itertools
 import json
-import numpy as np
 from abc import (
     ABCMeta,
     abstractmethod,
@@ -20,7 +19,6 @@ from abc import (
 from collections import UserDict
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
-from functools import cache
 from itertools import chain
 
 from .spec import GraphSpecification
@@ -54,7 +52,10 @@ class NodeChildren(Sequence):
 
     def __init__(self, children_iterable):
         self._tuple: tuple[GraphNode] = tuple(children_iterable)
-        self._id_arr = self._calculate_id_arr()
+        self._id_map = self._calculate_id_map()
+
+    def __deepcopy__(self, memo):
+        return type(self)(copy.deepcopy(self._tuple, memo))
 
     def __getitem__(self, idx):
         return self._tuple[idx]
@@ -63,11 +64,10 @@ class NodeChildren(Sequence):
         return iter(self._tuple)
 
     def __len__(self):
-        return self._id_arr.size
+        return len(self._tuple)
 
-    def _calculate_id_arr(self) -> np.ndarray:
-        return np.array(tuple(id(ch) for ch in self._tuple),
-                        copy=False)
+    def _calculate_id_map(self) -> dict[int, int]:
+        return {id(ch): i for i, ch in enumerate(self._tuple)}
 
     @property
     def tuple(self):
@@ -76,11 +76,14 @@ class NodeChildren(Sequence):
     @tuple.setter
     def tuple(self, new: tuple[GraphNode]):
         self._tuple = new
-        self._id_arr = self._calculate_id_arr()
+        self._id_map = self._calculate_id_map()
 
     def index(self, node):
         """Return index of the given node in the children tuple."""
-        return np.where(self._id_arr == id(node))[0][0]
+        try:
+            return self._id_map[id(node)]
+        except KeyError:
+            raise IndexError(f"Node {id(node)} is not a child.")
 
 
 class GraphNodeOptions(UserDict):
@@ -265,7 +268,6 @@ class GraphNode(metaclass=GraphNodeABCMeta):
         """
         return self.rank == self.leaf_rank
 
-    @cache
     def _get_children_index(self, children: NodeChildren):
         return children.index(self)
 
@@ -281,14 +283,14 @@ class GraphNode(metaclass=GraphNodeABCMeta):
         if self.rank + 1 == self.leaf_rank:
             return self.children.tuple
 
-        leafs_tuple = ()
+        leafs_list = []
         for child in self.children:
-            leafs_tuple += child.leafs
-        return leafs_tuple
+            leafs_list.extend(child.leafs)
+        return tuple(leafs_list)
 
     @property
     def leaf_rank(self) -> int:
-        return max(self._GRAPH_SPEC.hierarchy.values())
+        return self._GRAPH_SPEC.leaf_rank
 
     @property
     def map(self) -> dict[GraphNodeID, GraphNode]:
@@ -442,11 +444,11 @@ class GraphNode(metaclass=GraphNodeABCMeta):
         if hasattr(self, "_rankname"):
             return self._rankname
 
-        rank_dict = {v: k for k, v in self._GRAPH_SPEC.hierarchy.items()}
+        rank_names = self._GRAPH_SPEC.rank_names
         if rank is None:
-            return rank_dict[self.rank]
+            return rank_names[self.rank]
         else:
-            return rank_dict[rank]
+            return rank_names[rank]
 
     def replace_child(self, index: int, new: Sequence[GraphNode]):
         """Replace a child with one or several nodes."""
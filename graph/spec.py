@@ -11,6 +11,9 @@ from dataclasses import dataclass, field
 from functools import cached_property
 
 
+_NO_DEFAULT = object()
+
+
 class NodeConfigurationError(Exception):
 
     def __init__(self, message):
@@ -90,13 +93,13 @@ class ExclusiveOptionsABC(UserDict, ABC):
         return set(self.data.keys() - node_opts.keys())
 
     def missing_groups(self, node_opts: dict) -> tuple[dict]:
-        miss_groups = ()
+        miss_groups = []
         for group in self:
             comm_keys = group.keys() & node_opts.keys()
             if not any(comm_keys):
-                miss_groups += (comm_keys,)
+                miss_groups.append(comm_keys)
 
-        return miss_groups
+        return tuple(miss_groups)
 
 
 class MandatoryOptions(OptionsABC):
@@ -160,19 +163,34 @@ class NodeOptions(UserDict):
             **self._opt_ex.data
             }
 
-    @property
-    def exclusive_keygroups(self) -> tuple[set[str]]:
-        groups = tuple(g.keys() for g in self.mandatory_exclusive)
-        groups += tuple(g.keys() for g in self.optional_exclusive)
+    @cached_property
+    def _validators(self) -> dict[str, tuple[tuple, object, str]]:
+        """Types, default and error message of every option key."""
+        validators = {}
+        tables = ((self._mand, "'{}'"), (self._mand_ex.data, "{}"),
+                  (self._opt, "'{}'"), (self._opt_ex.data, "{}"))
+        for opts, key_fmt in tables:
+            for key, opt in opts.items():
+                err_msg = (f"Option entry {key_fmt.format(key)}"
+                           " has invalid type.")
+                validators[key] = (opt["types"],
+                                   opt.get("default", _NO_DEFAULT),
+                                   err_msg)
+        return validators
+
+    @cached_property
+    def exclusive_keygroups(self) -> tuple[frozenset[str]]:
+        groups = tuple(frozenset(g) for g in self.mandatory_exclusive)
+        groups += tuple(frozenset(g) for g in self.optional_exclusive)
         return groups
 
-    @property
-    def nonexclusive_keys(self) -> set[str]:
+    @cached_property
+    def nonexclusive_keys(self) -> frozenset[str]:
         keys = set()
         keys |= self.mandatory.keys()
         keys |= self.optional.keys()
         keys |= {"type"}
-        return keys
+        return frozenset(keys)
 
     @property
     def mandatory(self):
@@ -202,11 +220,21 @@ class NodeOptions(UserDict):
             NodeConfigurationError: Raised, if an option entry is incompatible
                 with the specification.
         """
-        opts_tup = (self._mand, self._mand_ex, self._opt, self._opt_ex)
-        for opt in opts_tup:
-            opt.check(node_opts)
+        validators = self._validators
+        unknown_keys = set()
+        for key, val in node_opts.items():
+            try:
+                types, default, err_msg = validators[key]
+            except KeyError:
+                if key != "type":
+                    unknown_keys.add(key)
+                continue
+
+            if default is not _NO_DEFAULT and val == default:
+                continue
+            if not isinstance(val, types):
+                raise NodeConfigurationError(err_msg)
 
-        unknown_keys = set(node_opts.keys() - self.keys()) - {"type"}
         if any(unknown_keys):
             raise NodeConfigurationError(
                 f"Unknown keys {unknown_keys}.")
@@ -225,10 +253,8 @@ class NodeOptions(UserDict):
         """
         self.check(node_opts)
         nonex_miss = self.nonexclusive_keys - node_opts.keys()
-        ex_miss = ()
-        for keys in self.exclusive_keygroups:
-            if not any(keys & node_opts.keys()):
-                ex_miss += (keys,)
+        ex_miss = tuple(keys for keys in self.exclusive_keygroups
+                        if not any(keys & node_opts.keys()))
 
         if not any((*nonex_miss, *ex_miss)):
             return
@@ -264,8 +290,8 @@ class NodeSpecification:
     def dictionary(self):
         return self._dict
 
-    @property
-    def options(self):
+    @cached_property
+    def options(self) -> NodeOptions:
         return NodeOptions(self._mand, self._mand_ex, self._opt, self._opt_ex)
 
     @property
@@ -319,6 +345,14 @@ class GraphSpecification:
     def hierarchy(self) -> dict[str, int]:
         return self._dict["hierarchy"]
 
+    @cached_property
+    def rank_names(self) -> dict[int, str]:
+        return {v: k for k, v in self.hierarchy.items()}
+
+    @cached_property
+    def leaf_rank(self) -> int:
+        return max(self.hierarchy.values())
+
     @cached_property
     def ranks(self) -> dict[str, RankSpecification]:
         ranks = {}
@@ -451,17 +485,17 @@ class NodeConfigurationProcessor:
                 optex_fetched[key] = spec.options[key]["default"]
 
         for group in mandex_miss:
-            matches = ()
+            matches = []
             for key in group:
                 try:
                     mandex_fetched[key] = node.options[key]
-                    matches += (key,)
+                    matches.append(key)
                 except KeyError:
                     continue
 
             if len(matches) > 1:
                 raise NodeConfigurationError(
-                    f"More than one exclusive option {matches}"
+                    f"More than one exclusive option {tuple(matches)}"
                     f" for node {node}")
             elif not any(matches):
                 raise NodeConfigurationError(
@@ -17,26 +17,50 @@ class RunGraphNode(GraphNode, metaclass=GraphNodeMeta,
                  ID: tuple = None):
         super().__init__(parent, options, rank)
         self._fixed_ID = GraphNodeID(ID) if ID is not None else None
+        self._cached_ID = None
+        self._cached_routines = None
 
     def _post_init(self):
         pass
 
+    def _clear_cached_ID(self):
+        """Drop the cached IDs of this node and all subordinate nodes."""
+        self._cached_ID = None
+        for child in self.children:
+            child._clear_cached_ID()
+
+    def _clear_cached_routines(self):
+        """Drop the cached routines of this node and all superior nodes."""
+        self._cached_routines = None
+        if not self.isroot:
+            self.parent._clear_cached_routines()
+
+    def _set_children_tuple(self, new):
+        super()._set_children_tuple(new)
+        for child in self.children:
+            child._clear_cached_ID()
+        self._clear_cached_routines()
+
     @property
     def ID(self) -> GraphNodeID:
         if self._fixed_ID is not None:
             return self._fixed_ID
 
-        return GraphNodeID(
-            (*self.parent.ID.tuple, self._get_children_index(
-                self.parent.children)))
+        if self._cached_ID is None:
+            self._cached_ID = GraphNodeID(
+                (*self.parent.ID.tuple, self._get_children_index(
+                    self.parent.children)))
+        return self._cached_ID
 
     @ID.setter
     def ID(self, new: tuple):
         self._fixed_ID = GraphNodeID(new)
+        self._clear_cached_ID()
 
     @ID.deleter
     def ID(self):
-        del self._fixed_ID
+        self._fixed_ID = None
+        self._clear_cached_ID()
 
     @property
     def num_routines(self):
@@ -44,7 +68,9 @@ class RunGraphNode(GraphNode, metaclass=GraphNodeMeta,
 
     @property
     def routines(self) -> tuple[RunGraphNode]:
-        return self.leafs
+        if self._cached_routines is None:
+            self._cached_routines = self.leafs
+        return self._cached_routines
 
 
 class RunGraphRoot(GraphRoot, RunGraphNode, metaclass=GraphRootMeta):
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import copy
+import functools
 import os
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from ..graph_classes.parser.file import FileGraphRoot
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file. Cached on path, modification time and size."""
+    with open(path, "r") as stream:
+        return yaml.load(stream, Loader=SafeLoader)
+
+
 class FileParser:
 
     def __init__(self):
@@ -20,7 +33,9 @@ class FileParser:
 
     def parse_yaml(self, path: str) -> FileGraphRoot:
         path = os.path.abspath(path)
-        with open(path, "r") as stream:
-            config = yaml.safe_load(stream)
+        stat = os.stat(path)
+        # graph nodes use the config dicts as their options and mutate them
+        config = copy.deepcopy(
+            _load_yaml(path, stat.st_mtime_ns, stat.st_size))
 
         return self.parse_dict(config)
@@ -4,6 +4,7 @@ import os
 _FUNCTIONS_PATH = os.getenv("PROTOCOL_FUNCTIONS_PATH")
 _SETTINGS_DICT = {
     "VERBOSE": False,
+    "PARALLEL_SCHEDULES": False,
     "FUNCTIONS_PATH": _FUNCTIONS_PATH,
 }
 
@@ -11,6 +12,7 @@ _SETTINGS_DICT = {
 class Settings:
     """Class for general library settings."""
     VERBOSE: bool = False
+    PARALLEL_SCHEDULES: bool = False
     FUNCTIONS_PATH: str = None
 
     def __init__(self, dict: dict):
@@ -28,12 +30,10 @@ class Settings:
 
     def check(self):
         """Check if library settings are complete. Returns bool."""
-        _missing = ()
-        for key in self.__annotations__:
-            if getattr(self, key) is None:
-                _missing += (key,)
+        _missing = [key for key in self.__annotations__
+                    if getattr(self, key) is None]
         if len(_missing) > 0:
-            print(f"Missing settings: {[key for key in _missing]}")
+            print(f"Missing settings: {_missing}")
             return False
         return True
 